@@ -0,0 +1,175 @@
+"""
+Admission Control for DNA Detection Work
+--------------------------
+This module estimates the cost of detection requests from the size N of the DNA
+matrix and keeps heavy requests away from the event loop: small requests run
+inline, while heavy ones run on a separate bounded worker pool whose queued cost
+is capped by a budget. Requests over the budget are shed so they can be retried later.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+
+# Load environment variables from a .env file
+load_dotenv()
+
+# Admission control configuration
+MAX_DNA_SIZE = int(os.environ.get("MAX_DNA_SIZE", 10000))  # Largest N accepted (NxN matrix)
+HEAVY_DNA_SIZE = int(os.environ.get("HEAVY_DNA_SIZE", 100))  # N from which detection runs on the heavy pool
+HEAVY_WORKERS = int(os.environ.get("HEAVY_WORKERS", 2))  # Number of workers in the heavy pool
+ADMISSION_COST_BUDGET = int(os.environ.get("ADMISSION_COST_BUDGET", 600 * 10**9))  # Max queued cost (ns)
+RETRY_AFTER_SECONDS = int(os.environ.get("RETRY_AFTER_SECONDS", 5))  # Retry-After sent when shedding
+
+# Estimated worst-case CPU time (ns) per matrix cell of each kind of work
+VALIDATION_CELL_COST = 15  # Validation and SHA-256 hash of the matrix
+SUMMARY_CELL_COST = 500  # summarize_lines, which always scans every line
+DETECTION_CELL_COST = 2500  # is_mutant on a non-mutant matrix (no early exit)
+
+
+class RequestTooLargeError(Exception):
+    """Raised when a DNA matrix exceeds the maximum accepted size."""
+    pass
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when heavy work is shed because the queued cost is over budget."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Cost-aware admission controller for detection work.
+
+    The cost of a request is its estimated CPU time in nanoseconds: N² cells times
+    the per-cell cost of the work. Work cheaper than detecting a matrix of the
+    heavy size runs inline; heavier work is queued on a bounded process pool as
+    long as the total queued cost stays within the budget. A custom executor can be given instead of the process pool.
+    """
+
+    def __init__(
+        self,
+        max_size: int = MAX_DNA_SIZE,
+        heavy_size: int = HEAVY_DNA_SIZE,
+        workers: int = HEAVY_WORKERS,
+        cost_budget: int = ADMISSION_COST_BUDGET,
+        retry_after: int = RETRY_AFTER_SECONDS,
+        executor: Optional[Executor] = None
+    ):
+        self.max_size = max_size
+        self.heavy_cost = self.estimate_cost(heavy_size, DETECTION_CELL_COST)
+        self.workers = workers
+        self.cost_budget = cost_budget
+        self.retry_after = retry_after
+        self.queued_requests = 0
+        self.queued_cost = 0
+        self.shed_count = 0
+        self.too_large_count = 0
+        self._executor = executor
+
+    @staticmethod
+    def estimate_cost(n: int, cell_cost: int) -> int:
+        """
+        Estimate the cost of work scanning a whole NxN DNA matrix.
+
+        Args:
+            n (int): Size of the DNA matrix.
+            cell_cost (int): Cost per cell of the work (e.g. `DETECTION_CELL_COST`).
+
+        Returns:
+            int: Estimated CPU time in nanoseconds.
+        """
+        return n * n * cell_cost
+
+    def check_size(self, n: int) -> None:
+        """
+        Ensure the DNA matrix does not exceed the maximum accepted size.
+
+        Args:
+            n (int): Size of the DNA matrix.
+
+        Raises:
+            RequestTooLargeError: If N is over the maximum size.
+        """
+        if n > self.max_size:
+            self.too_large_count += 1
+            raise RequestTooLargeError(
+                f"DNA matrix size {n}x{n} exceeds the maximum of {self.max_size}x{self.max_size}"
+            )
+
+    async def run(self, cost: int, func: Callable[..., Any], *args: Any, shed: bool = True) -> Any:
+        """
+        Run detection work according to its cost.
+
+        Args:
+            cost (int): Estimated cost of the work (see `estimate_cost`).
+            func (Callable[..., Any]): Picklable function performing the work.
+            *args (Any): Arguments for `func`.
+            shed (bool): Whether the work may be shed; follow-up work of an already
+                admitted request is queued regardless of the budget.
+
+        Returns:
+            Any: The result of `func`.
+
+        Raises:
+            AdmissionRejectedError: If queuing the work would exceed the cost budget.
+        """
+        # Light work runs inline, it is cheaper than handing it to another process
+        if cost < self.heavy_cost:
+            return func(*args)
+
+        # Shed heavy work over budget; an idle pool always admits one request
+        if shed and self.queued_requests and self.queued_cost + cost > self.cost_budget:
+            self.shed_count += 1
+            raise AdmissionRejectedError(
+                "Server is busy with large DNA analyses, please retry later",
+                retry_after=self.retry_after
+            )
+
+        self.queued_requests += 1
+        self.queued_cost += cost
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+        finally:
+            self.queued_requests -= 1
+            self.queued_cost -= cost
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retrieve the current admission control counters.
+
+        Returns:
+            dict: Queue depth, queued cost, budget and rejection counts.
+        """
+        return {
+            "queued_requests": self.queued_requests,
+            "queued_cost": self.queued_cost,
+            "cost_budget": self.cost_budget,
+            "shed_count": self.shed_count,
+            "too_large_count": self.too_large_count
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the heavy worker pool, if it was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        """Create the heavy worker pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+
+# Shared admission controller for the application
+admission_controller = AdmissionController()
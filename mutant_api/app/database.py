@@ -15,8 +15,10 @@ DB_HOST = os.environ.get("DB_HOST")  # Database host address
 DB_PORT = os.environ.get("DB_PORT")  # Database port number
 DB_NAME = os.environ.get("DB_NAME")  # Database name
 
-# Form the SQLAlchemy connection URL
-SQLALCHEMY_DATABASE_URL = f"mysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# Form the SQLAlchemy connection URL (DATABASE_URL overrides it, e.g. to run the tests on SQLite)
+SQLALCHEMY_DATABASE_URL = os.environ.get("DATABASE_URL") or (
+    f"mysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+)
 
 # Create a SQLAlchemy engine for connecting to the database
 engine = create_engine(
@@ -1,8 +1,12 @@
-from typing import List, Set, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Set, Optional
+from dataclasses import dataclass, field
 from . import models
 from sqlalchemy.orm import Session
+import base64
 import hashlib
+import os
+import struct
+import zlib
 
 @dataclass
 class DNAValidationResult:
@@ -15,18 +19,150 @@ class DNAValidationResult:
         sequence_hash (str): SHA256 hash of the DNA sequence.
         is_mutant (Optional[bool]): Flag indicating if the DNA sequence is mutant (if checked).
         is_processed (bool): Indicates if the DNA sequence has already been processed.
+        line_summary (Optional[str]): Stored per-line run summary (if processed and kept).
     """
     is_valid: bool
     error_message: str = ""
     sequence_hash: str = ""
     is_mutant: Optional[bool] = None
     is_processed: bool = False
+    line_summary: Optional[str] = None
+
+@dataclass
+class LineSummary:
+    """
+    Data class to represent the per-line run summary of an analyzed DNA matrix.
+
+    Every line that can hold a run of four identical letters contributes to the
+    mutant count: rows and columns count once when they contain a run, while
+    diagonals count every 4-letter window of identical letters. Keeping these
+    per-line contributions allows re-analyzing only the lines touched by an edit.
+
+    Attributes:
+        size (int): Size N of the NxN DNA matrix.
+        rows (Set[int]): Indexes of rows containing a run.
+        columns (Set[int]): Indexes of columns containing a run.
+        diagonals (Dict[int, int]): Window count per main diagonal, keyed by column - row.
+        anti_diagonals (Dict[int, int]): Window count per secondary diagonal, keyed by row + column.
+    """
+    size: int
+    rows: Set[int] = field(default_factory=set)
+    columns: Set[int] = field(default_factory=set)
+    diagonals: Dict[int, int] = field(default_factory=dict)
+    anti_diagonals: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def sequences_found(self) -> int:
+        """Total number of sequences of four identical letters in the matrix."""
+        return (
+            len(self.rows)
+            + len(self.columns)
+            + sum(self.diagonals.values())
+            + sum(self.anti_diagonals.values())
+        )
+
+    @property
+    def is_mutant(self) -> bool:
+        """A mutant has more than one sequence of 4 identical letters in any direction."""
+        return self.sequences_found > 1
+
+    def encode(self) -> str:
+        """
+        Serialize the summary into a compact string.
+
+        Rows and columns are stored as bitsets and the diagonal window counts as
+        packed little-endian integers, compressed with zlib and base64 encoded.
+
+        Returns:
+            str: Compact representation of the summary.
+        """
+        n = self.size
+        lines = max(0, 2 * n - 7)  # Diagonals long enough to hold a run
+        width = 2 if n <= 0xFFFF else 4  # Bytes per diagonal window count
+        diagonals = [self.diagonals.get(offset, 0) for offset in range(-(n - 4), n - 3)]
+        anti_diagonals = [self.anti_diagonals.get(index, 0) for index in range(3, 2 * n - 4)]
+        raw = b"".join([
+            struct.pack("<IB", n, width),
+            _pack_bitset(self.rows, n),
+            _pack_bitset(self.columns, n),
+            struct.pack(f"<{lines}{'H' if width == 2 else 'I'}", *diagonals),
+            struct.pack(f"<{lines}{'H' if width == 2 else 'I'}", *anti_diagonals),
+        ])
+        return base64.b64encode(zlib.compress(raw)).decode("ascii")
+
+    @classmethod
+    def decode(cls, data: str) -> "LineSummary":
+        """
+        Rebuild a summary from its compact representation.
+
+        Args:
+            data (str): String produced by `encode`.
+
+        Returns:
+            LineSummary: The decoded summary.
+        """
+        raw = zlib.decompress(base64.b64decode(data))
+        n, width = struct.unpack_from("<IB", raw)
+        lines = max(0, 2 * n - 7)
+        bitset_size = (n + 7) // 8
+        offset = struct.calcsize("<IB")
+        rows = _unpack_bitset(raw[offset:offset + bitset_size])
+        offset += bitset_size
+        columns = _unpack_bitset(raw[offset:offset + bitset_size])
+        offset += bitset_size
+        count_format = f"<{lines}{'H' if width == 2 else 'I'}"
+        diagonals = struct.unpack_from(count_format, raw, offset)
+        anti_diagonals = struct.unpack_from(count_format, raw, offset + lines * width)
+        return cls(
+            size=n,
+            rows=rows,
+            columns=columns,
+            diagonals={o: c for o, c in zip(range(-(n - 4), n - 3), diagonals) if c},
+            anti_diagonals={i: c for i, c in zip(range(3, 2 * n - 4), anti_diagonals) if c},
+        )
+
+def _pack_bitset(indexes: Set[int], size: int) -> bytes:
+    """Pack a set of indexes below `size` into a little-endian bitset."""
+    bits = 0
+    for index in indexes:
+        bits |= 1 << index
+    return bits.to_bytes((size + 7) // 8, "little")
+
+def _unpack_bitset(data: bytes) -> Set[int]:
+    """Unpack a little-endian bitset into the set of its indexes."""
+    bits = int.from_bytes(data, "little")
+    return {index for index in range(bits.bit_length()) if bits >> index & 1}
 
 class DNAService:
     """Centralized service for DNA sequence validation and mutation detection."""
     
     VALID_BASES: Set[str] = set('ATCG')
 
+    # Maximum size (in bytes) of a stored line summary; larger summaries are not persisted.
+    # An encoded summary takes at most about 11 bytes per row, so the default covers
+    # every matrix up to N=20000 (random matrices need about 5.5 bytes per row).
+    LINE_SUMMARY_MAX_BYTES: int = int(os.environ.get("LINE_SUMMARY_MAX_BYTES", 262144))
+
+    # Maximum number of cell edits per re-analysis request; edits are re-analyzed
+    # inline, each rescanning about 4N cells (about 3ms at N=10000)
+    MAX_DNA_EDITS: int = int(os.environ.get("MAX_DNA_EDITS", 16))
+
+    @classmethod
+    def serialize_line_summary(cls, summary: LineSummary) -> Optional[str]:
+        """
+        Serialize a line summary for storage, enforcing the size cap.
+
+        Args:
+            summary (LineSummary): Per-line run summary of an analyzed DNA matrix.
+
+        Returns:
+            Optional[str]: Encoded summary, or None if it exceeds the size cap.
+        """
+        data = summary.encode()
+        if len(data) > cls.LINE_SUMMARY_MAX_BYTES:
+            return None
+        return data
+
     @classmethod
     def calculate_hash(cls, dna: List[str]) -> str:
         """
@@ -42,17 +178,33 @@ class DNAService:
         return hashlib.sha256(concatenated_dna.encode()).hexdigest()
 
     @classmethod
-    def validate_and_check_existence(cls, dna: List[str], db: Session) -> DNAValidationResult:
+    def save_line_summary(cls, sequence_hash: str, summary: LineSummary, db: Session) -> None:
         """
-        Validate the DNA sequence format and check if it has been processed before.
+        Store the line summary of an already processed DNA sequence, if it fits the size cap.
+
+        Args:
+            sequence_hash (str): SHA256 hash of the DNA sequence.
+            summary (LineSummary): Per-line run summary of the DNA sequence.
+            db (Session): SQLAlchemy database session.
+        """
+        data = cls.serialize_line_summary(summary)
+        if data is None:
+            return
+        db.query(models.DNASequence).filter(
+            models.DNASequence.sequence_hash == sequence_hash
+        ).update({models.DNASequence.line_summary: data})
+        db.commit()
+
+    @classmethod
+    def validate_sequence(cls, dna: List[str]) -> DNAValidationResult:
+        """
+        Validate the DNA sequence format and calculate its hash, without any database access.
 
         Args:
             dna (List[str]): List of DNA string sequences.
-            db (Session): SQLAlchemy database session for querying previous records.
 
         Returns:
-            DNAValidationResult: Object containing validation results, 
-            including existence check and mutation status if previously processed.
+            DNAValidationResult: Object containing validation results and the sequence hash.
         """
         
         # Check if the DNA sequence is empty
@@ -73,27 +225,64 @@ class DNAService:
                     f"DNA sequence contains invalid characters: {', '.join(invalid_bases)}"
                 )
 
-        # Calculate the hash of the DNA sequence
-        sequence_hash = cls.calculate_hash(dna)
+        # Return validation result with the hash of the DNA sequence
+        return DNAValidationResult(
+            is_valid=True,
+            sequence_hash=cls.calculate_hash(dna),
+            is_processed=False
+        )
 
-        # Check if the DNA sequence already exists in the database
-        if db:  # Only query the database if a session is provided
-            db_sequence = db.query(models.DNASequence).filter(
-                models.DNASequence.sequence_hash == sequence_hash
-            ).first()
+    @classmethod
+    def check_existence(cls, sequence_hash: str, db: Session) -> DNAValidationResult:
+        """
+        Check if an already validated DNA sequence has been processed before.
 
-            # If found, return existing data with mutation status
-            if db_sequence:
-                return DNAValidationResult(
-                    is_valid=True,
-                    sequence_hash=sequence_hash,
-                    is_mutant=db_sequence.is_mutant,
-                    is_processed=True
-                )
+        Args:
+            sequence_hash (str): SHA256 hash of the DNA sequence.
+            db (Session): SQLAlchemy database session for querying previous records.
 
-        # Return validation result for new DNA sequence
+        Returns:
+            DNAValidationResult: Object containing the existence check 
+            and mutation status if previously processed.
+        """
+        db_sequence = db.query(models.DNASequence).filter(
+            models.DNASequence.sequence_hash == sequence_hash
+        ).first()
+
+        # If found, return existing data with mutation status
+        if db_sequence:
+            return DNAValidationResult(
+                is_valid=True,
+                sequence_hash=sequence_hash,
+                is_mutant=db_sequence.is_mutant,
+                is_processed=True,
+                line_summary=db_sequence.line_summary
+            )
+
+        # Return result for new DNA sequence
         return DNAValidationResult(
             is_valid=True,
             sequence_hash=sequence_hash,
             is_processed=False
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def validate_and_check_existence(cls, dna: List[str], db: Session) -> DNAValidationResult:
+        """
+        Validate the DNA sequence format and check if it has been processed before.
+
+        Args:
+            dna (List[str]): List of DNA string sequences.
+            db (Session): SQLAlchemy database session for querying previous records.
+
+        Returns:
+            DNAValidationResult: Object containing validation results, 
+            including existence check and mutation status if previously processed.
+        """
+        validation_result = cls.validate_sequence(dna)
+
+        # Only query the database if the sequence is valid and a session is provided
+        if not validation_result.is_valid or not db:
+            return validation_result
+
+        return cls.check_existence(validation_result.sequence_hash, db)
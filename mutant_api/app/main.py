@@ -1,21 +1,93 @@
-from fastapi import FastAPI, HTTPException, Depends
+from contextlib import asynccontextmanager
+from typing import List
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from . import models, schemas
 from .database import engine, get_db
-from .dna_service import DNAService
-from .mutant_detector import is_mutant, DNAValidationError
+from .dna_service import DNAService, DNAValidationResult, LineSummary
+from .admission import (
+    admission_controller, RequestTooLargeError, AdmissionRejectedError,
+    VALIDATION_CELL_COST, SUMMARY_CELL_COST, DETECTION_CELL_COST
+)
+from .mutant_detector import (
+    analyze_sequence, summarize_lines, prepare_edits, reanalyze_lines, DNAValidationError
+)
 
 # Initialize the database tables
 models.Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Shut down the heavy detection worker pool when the application stops."""
+    yield
+    admission_controller.shutdown()
+
 # Create the FastAPI application
 app = FastAPI(
     title="Mutant Detection API",
     description="API for detecting mutant DNA sequences",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+@app.exception_handler(RequestTooLargeError)
+async def request_too_large_handler(request: Request, exc: RequestTooLargeError):
+    """Reject DNA matrices over the maximum size with 413."""
+    return JSONResponse(status_code=413, content={"detail": str(exc)})
+
+@app.exception_handler(AdmissionRejectedError)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejectedError):
+    """Shed detection work over the queued cost budget with 503 and Retry-After."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+def invalid_dna_error(message: str, dna: List[str]) -> RequestValidationError:
+    """
+    Build the validation error for an invalid DNA sequence.
+
+    The DNA is fully validated in the endpoints (off the event loop for large 
+    matrices) but reported as the request validation error (422) it used to be.
+
+    Args:
+        message (str): Validation error message.
+        dna (List[str]): The invalid DNA sequence.
+
+    Returns:
+        RequestValidationError: Error rendered by FastAPI as a 422 response.
+    """
+    return RequestValidationError([{
+        "type": "value_error",
+        "loc": ("body", "dna"),
+        "msg": f"Value error, {message}",
+        "input": dna,
+        "ctx": {"error": {}}
+    }])
+
+def already_processed_response(validation_result: DNAValidationResult) -> JSONResponse:
+    """
+    Build the conflict response for a DNA sequence that was already processed.
+
+    Args:
+        validation_result (DNAValidationResult): Existence check of the DNA sequence.
+
+    Returns:
+        JSONResponse: 409 response with the stored mutation status.
+    """
+    return JSONResponse(
+        status_code=409, 
+        content={
+            "message": "DNA sequence already processed",
+            "sequence_hash": validation_result.sequence_hash,
+            "is_mutant": validation_result.is_mutant
+        }
+    )
+
 @app.post("/mutant/", status_code=200)
 async def analyze_dna(
     dna_sequence: schemas.DNASequence,
@@ -26,7 +98,8 @@ async def analyze_dna(
     
     This endpoint validates and processes a DNA sequence for mutant detection. 
     If the sequence has been processed previously, it returns the stored result; 
-    otherwise, it analyzes and stores the result in the database.
+    otherwise, it analyzes and stores the result in the database. Large matrices 
+    are analyzed on a bounded worker pool and may be rejected while it is busy.
 
     Args:
         dna_sequence (schemas.DNASequence): The DNA sequence data in JSON format.
@@ -35,34 +108,141 @@ async def analyze_dna(
     Returns:
         JSONResponse: Response indicating if the DNA is mutant or not, 
         along with conflict status if it was previously processed.
+
+    Raises:
+        RequestValidationError: 422 if the DNA is invalid.
+        HTTPException: 413 if the matrix is too large, 
+        503 (with Retry-After) if heavy analyses are over the queued cost budget.
     """
     try:
-        # Validate DNA and check if it already exists in the database
-        validation_result = DNAService.validate_and_check_existence(dna_sequence.dna, db)
+        # Validate, hash and analyze the DNA as a single task (on the worker pool
+        # for large matrices); its size was already checked by the request schema.
+        # Duplicates are only detected afterwards, as the hash is part of the task.
+        n = len(dna_sequence.dna)
+        validation_result, result = await admission_controller.run(
+            admission_controller.estimate_cost(n, VALIDATION_CELL_COST + DETECTION_CELL_COST),
+            analyze_sequence, dna_sequence.dna
+        )
         
         if not validation_result.is_valid:
-            raise DNAValidationError(validation_result.error_message)
+            raise invalid_dna_error(validation_result.error_message, dna_sequence.dna)
+
+        # Check if the DNA sequence already exists in the database
+        validation_result = DNAService.check_existence(validation_result.sequence_hash, db)
+            
+        if validation_result.is_processed:
+            return already_processed_response(validation_result)
+
+        # Store the DNA analysis result in the database (the per-line summary used
+        # by /mutant/edits/ is only built once the sequence is first edited)
+        db_sequence = models.DNASequence(
+            sequence_hash=validation_result.sequence_hash,
+            is_mutant=result
+        )
+        db.add(db_sequence)
+        try:
+            db.commit()
+        except IntegrityError:
+            # The same DNA sequence was stored by a concurrent request while this one was analyzed
+            db.rollback()
+            return already_processed_response(
+                DNAService.check_existence(validation_result.sequence_hash, db)
+            )
+        
+        return JSONResponse(
+            status_code=200 if result else 403, 
+            content={"is_mutant": result}
+        )
+        
+    except DNAValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/mutant/edits/", status_code=200)
+async def reanalyze_dna(
+    edit_request: schemas.DNAEditRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Re-analyze a previously analyzed DNA sequence after editing some of its cells.
+    
+    The original matrix must have been analyzed before. Only the rows, columns and 
+    diagonals passing through the edited cells are scanned, using the per-line 
+    summary stored with the original matrix. The summary is built (with a full 
+    scan) the first time a matrix is edited and kept when it fits the size cap.
+
+    Args:
+        edit_request (schemas.DNAEditRequest): The original DNA sequence and the cell edits.
+        db (Session): SQLAlchemy session dependency.
+
+    Returns:
+        JSONResponse: Response indicating if the edited DNA is mutant or not, 
+        along with conflict status if it was previously processed.
+
+    Raises:
+        RequestValidationError: 422 if the DNA is invalid.
+        HTTPException: 400 if an edit is invalid, 404 if the original 
+        DNA was not analyzed before, 413 if the matrix is too large, 503 (with 
+        Retry-After) if heavy analyses are over the queued cost budget.
+    """
+    try:
+        # Validate and hash the reference DNA, apply the edits and hash the edited DNA
+        # as a single task (on the worker pool for large matrices); the size was
+        # already checked against the maximum by the request schema
+        n = len(edit_request.dna)
+        edits = [(edit.row, edit.col, edit.base) for edit in edit_request.edits]
+        reference, edited_hash = await admission_controller.run(
+            admission_controller.estimate_cost(n, 2 * VALIDATION_CELL_COST),
+            prepare_edits, edit_request.dna, edits
+        )
+        
+        if not reference.is_valid:
+            raise invalid_dna_error(reference.error_message, edit_request.dna)
+
+        # Look up the previously analyzed (reference) DNA sequence
+        reference = DNAService.check_existence(reference.sequence_hash, db)
             
+        if not reference.is_processed:
+            raise HTTPException(status_code=404, detail="Reference DNA sequence not found")
+
+        # Check if the edited DNA sequence already exists in the database
+        validation_result = DNAService.check_existence(edited_hash, db)
+        
         if validation_result.is_processed:
-            return JSONResponse(
-                status_code=409, 
-                content={
-                    "message": "DNA sequence already processed",
-                    "sequence_hash": validation_result.sequence_hash,
-                    "is_mutant": validation_result.is_mutant
-                }
+            return already_processed_response(validation_result)
+
+        # Build the reference summary on its first edit and keep it for later edits;
+        # the request was already admitted and validated, so it is not shed here
+        if reference.line_summary:
+            reference_summary = LineSummary.decode(reference.line_summary)
+        else:
+            reference_summary = await admission_controller.run(
+                admission_controller.estimate_cost(n, SUMMARY_CELL_COST),
+                summarize_lines, edit_request.dna, False,
+                shed=False
             )
+            DNAService.save_line_summary(reference.sequence_hash, reference_summary, db)
 
-        # Detect mutant status if DNA is new
-        result = is_mutant(dna_sequence.dna)
+        # Recompute only the lines touched by the edits, inline: each edit rescans
+        # one row, one column and two diagonals, which is cheaper than shipping
+        # the matrix to a worker process
+        summary = reanalyze_lines(edit_request.dna, reference_summary, edits)
+        result = summary.is_mutant
         
         # Store the DNA analysis result in the database
         db_sequence = models.DNASequence(
             sequence_hash=validation_result.sequence_hash,
-            is_mutant=result
+            is_mutant=result,
+            line_summary=DNAService.serialize_line_summary(summary)
         )
         db.add(db_sequence)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            # The same DNA sequence was stored by a concurrent request while this one was analyzed
+            db.rollback()
+            return already_processed_response(
+                DNAService.check_existence(validation_result.sequence_hash, db)
+            )
         
         return JSONResponse(
             status_code=200 if result else 403, 
@@ -102,4 +282,17 @@ async def get_stats(db: Session = Depends(get_db)):
         "count_mutant_dna": mutant_count,
         "count_human_dna": human_count,
         "ratio": round(ratio, 2)
-    }
\ No newline at end of file
+    }
+
+@app.get("/admission/", response_model=schemas.AdmissionStats)
+async def get_admission_stats():
+    """
+    Retrieve admission control statistics for detection work.
+
+    This endpoint returns the number of heavy analyses queued or running on the 
+    worker pool, their total estimated cost, and how many requests were rejected.
+
+    Returns:
+        dict: A dictionary with queue depth, queued cost, cost budget and rejection counts.
+    """
+    return admission_controller.stats()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, Integer
+from sqlalchemy import Column, String, Boolean, Integer, Text
 from sqlalchemy.ext.declarative import declarative_base
 from .database import Base
 import hashlib
@@ -12,6 +12,8 @@ class DNASequence(Base):
         id (int): Unique identifier for the DNA sequence.
         sequence_hash (str): SHA256 hash of the DNA sequence.
         is_mutant (bool): Flag indicating whether the DNA sequence belongs to a mutant.
+        line_summary (str): Compact encoded per-line run summary, used for incremental
+            re-analysis of edited matrices (NULL until first edited or when over the size cap).
 
     Methods:
         calculate_hash(dna_sequence): Calculates a unique hash for the given DNA sequence.
@@ -21,6 +23,7 @@ class DNASequence(Base):
     id = Column(Integer, primary_key=True, index=True)
     sequence_hash = Column(String(255), unique=True, index=True)
     is_mutant = Column(Boolean)
+    line_summary = Column(Text(16777215), nullable=True)  # MEDIUMTEXT on MySQL
 
     @staticmethod
     def calculate_hash(dna_sequence):
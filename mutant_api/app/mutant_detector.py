@@ -6,9 +6,9 @@ A mutant DNA sequence contains more than one sequence of four identical letters
 arranged horizontally, vertically, or diagonally in a matrix.
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
-from .dna_service import DNAService  # Changed from DNAValidator to DNAService
+from .dna_service import DNAService, DNAValidationResult, LineSummary  # Changed from DNAValidator to DNAService
 
 class DNAValidationError(Exception):
     """Custom exception for DNA validation errors."""
@@ -33,6 +33,27 @@ def is_mutant(dna: List[str]) -> bool:
     if not validation_result.is_valid:
         raise DNAValidationError(validation_result.error_message)
     
+    return _is_mutant(dna)
+
+def analyze_sequence(dna: List[str]) -> Tuple[DNAValidationResult, Optional[bool]]:
+    """
+    Validates, hashes and detects a DNA sequence in a single pass of work,
+    so it can be handed to a worker process as one task.
+    
+    Args:
+        dna (List[str]): List of strings representing the DNA matrix
+        
+    Returns:
+        Tuple[DNAValidationResult, Optional[bool]]: Validation result (with the
+        sequence hash) and mutant status, which is None if the DNA is invalid
+    """
+    validation_result = DNAService.validate_sequence(dna)
+    if not validation_result.is_valid:
+        return validation_result, None
+    return validation_result, _is_mutant(dna)
+
+def _is_mutant(dna: List[str]) -> bool:
+    """Detects if an already validated DNA sequence corresponds to a mutant."""
     n = len(dna)
     sequences_found = 0
     
@@ -73,4 +94,202 @@ def is_mutant(dna: List[str]) -> bool:
                 if sequences_found > 1:
                     return True
     
-    return False
\ No newline at end of file
+    return False
+
+def _count_windows(line: str) -> int:
+    """Count the 4-letter windows of identical letters along a line."""
+    windows = 0
+    run = 0
+    previous = None
+    for base in line:
+        run = run + 1 if base == previous else 1
+        previous = base
+        if run >= 4:
+            windows += 1
+    return windows
+
+
+def _has_sequence(line: str) -> bool:
+    """Check if a line contains 4 consecutive identical letters."""
+    return bool(re.search(r'([ATCG])\1{3}', line))
+
+
+def _diagonal(dna: List[str], offset: int) -> str:
+    """Main diagonal (top-left to bottom-right) with the given column - row offset."""
+    n = len(dna)
+    return ''.join(dna[i][i + offset] for i in range(max(0, -offset), min(n, n - offset)))
+
+
+def _anti_diagonal(dna: List[str], index: int) -> str:
+    """Secondary diagonal (top-right to bottom-left) with the given row + column index."""
+    n = len(dna)
+    return ''.join(dna[i][index - i] for i in range(max(0, index - n + 1), min(n, index + 1)))
+
+
+def _summarize_row(dna: List[str], summary: LineSummary, row: int) -> None:
+    """Recompute the summary entry of a single row."""
+    summary.rows.discard(row)
+    if _has_sequence(dna[row]):
+        summary.rows.add(row)
+
+
+def _summarize_column(dna: List[str], summary: LineSummary, col: int) -> None:
+    """Recompute the summary entry of a single column."""
+    summary.columns.discard(col)
+    if _has_sequence(''.join(row[col] for row in dna)):
+        summary.columns.add(col)
+
+
+def _summarize_diagonal(dna: List[str], summary: LineSummary, offset: int) -> None:
+    """Recompute the summary entry of a single main diagonal."""
+    summary.diagonals.pop(offset, None)
+    if abs(offset) <= len(dna) - 4:
+        windows = _count_windows(_diagonal(dna, offset))
+        if windows:
+            summary.diagonals[offset] = windows
+
+
+def _summarize_anti_diagonal(dna: List[str], summary: LineSummary, index: int) -> None:
+    """Recompute the summary entry of a single secondary diagonal."""
+    summary.anti_diagonals.pop(index, None)
+    if 3 <= index <= 2 * len(dna) - 5:
+        windows = _count_windows(_anti_diagonal(dna, index))
+        if windows:
+            summary.anti_diagonals[index] = windows
+
+
+def summarize_lines(dna: List[str], validate: bool = True) -> LineSummary:
+    """
+    Builds the per-line run summary of a DNA matrix.
+    Unlike `is_mutant`, every line is scanned so the summary can be reused
+    to re-analyze edited versions of the same matrix.
+
+    Args:
+        dna (List[str]): List of strings representing the DNA matrix
+        validate (bool): Whether to validate the DNA first (skip if the caller already did)
+
+    Returns:
+        LineSummary: Per-line run summary; `summary.is_mutant` matches `is_mutant(dna)`
+
+    Raises:
+        DNAValidationError: If the DNA sequence is invalid
+    """
+    if validate:
+        validation_result = DNAService.validate_and_check_existence(dna, db=None)
+        if not validation_result.is_valid:
+            raise DNAValidationError(validation_result.error_message)
+
+    n = len(dna)
+    summary = LineSummary(size=n)
+    for i in range(n):
+        _summarize_row(dna, summary, i)
+        _summarize_column(dna, summary, i)
+    for offset in range(-(n - 4), n - 3):
+        _summarize_diagonal(dna, summary, offset)
+    for index in range(3, 2 * n - 4):
+        _summarize_anti_diagonal(dna, summary, index)
+    return summary
+
+
+def apply_edits(dna: List[str], edits: Iterable[Tuple[int, int, str]]) -> List[str]:
+    """
+    Returns a copy of the DNA matrix with the given cell edits applied.
+
+    Args:
+        dna (List[str]): List of strings representing the DNA matrix
+        edits (Iterable[Tuple[int, int, str]]): (row, column, base) cell edits
+
+    Returns:
+        List[str]: The edited DNA matrix
+
+    Raises:
+        DNAValidationError: If an edit is out of bounds or uses an invalid base
+    """
+    n = len(dna)
+    edited_rows: Dict[int, List[str]] = {}
+    for row, col, base in edits:
+        if not (0 <= row < n and 0 <= col < n):
+            raise DNAValidationError(f"Edit position ({row}, {col}) is outside the {n}x{n} matrix")
+        if base not in DNAService.VALID_BASES:
+            raise DNAValidationError(f"Edit contains invalid base: {base}")
+        # Each edited row is copied once, however many of its cells are edited
+        if row not in edited_rows:
+            edited_rows[row] = list(dna[row])
+        edited_rows[row][col] = base
+
+    edited = list(dna)
+    for row, cells in edited_rows.items():
+        edited[row] = ''.join(cells)
+    return edited
+
+
+def prepare_edits(
+    dna: List[str],
+    edits: Iterable[Tuple[int, int, str]]
+) -> Tuple[DNAValidationResult, str]:
+    """
+    Validates and hashes a DNA matrix, applies cell edits to it and hashes the
+    edited matrix, so the whole-matrix work of an edit request is one task.
+
+    Args:
+        dna (List[str]): List of strings representing the DNA matrix
+        edits (Iterable[Tuple[int, int, str]]): (row, column, base) cell edits
+
+    Returns:
+        Tuple[DNAValidationResult, str]: Validation result of the original matrix
+        (with its hash) and the hash of the edited matrix ("" if the DNA is invalid)
+
+    Raises:
+        DNAValidationError: If an edit is out of bounds or uses an invalid base
+    """
+    validation_result = DNAService.validate_sequence(dna)
+    if not validation_result.is_valid:
+        return validation_result, ""
+    return validation_result, DNAService.calculate_hash(apply_edits(dna, edits))
+
+
+def reanalyze_lines(
+    dna: List[str],
+    summary: LineSummary,
+    edits: Iterable[Tuple[int, int, str]]
+) -> LineSummary:
+    """
+    Updates a line summary after editing cells of a previously analyzed matrix.
+    Only the rows, columns and diagonals passing through edited cells are scanned,
+    so the work is proportional to N times the number of edits.
+
+    Args:
+        dna (List[str]): The DNA matrix before the edits
+        summary (LineSummary): Line summary of the matrix before the edits
+        edits (Iterable[Tuple[int, int, str]]): (row, column, base) cell edits
+
+    Returns:
+        LineSummary: Line summary of the edited matrix
+
+    Raises:
+        DNAValidationError: If the summary does not match the matrix size,
+        or an edit is out of bounds or uses an invalid base
+    """
+    if summary.size != len(dna):
+        raise DNAValidationError("Line summary does not match the DNA matrix size")
+
+    edits = list(edits)
+    dna = apply_edits(dna, edits)
+
+    updated = LineSummary(
+        size=summary.size,
+        rows=set(summary.rows),
+        columns=set(summary.columns),
+        diagonals=dict(summary.diagonals),
+        anti_diagonals=dict(summary.anti_diagonals)
+    )
+    positions = {(row, col) for row, col, _ in edits}
+    for row in {row for row, _ in positions}:
+        _summarize_row(dna, updated, row)
+    for col in {col for _, col in positions}:
+        _summarize_column(dna, updated, col)
+    for offset in {col - row for row, col in positions}:
+        _summarize_diagonal(dna, updated, offset)
+    for index in {row + col for row, col in positions}:
+        _summarize_anti_diagonal(dna, updated, index)
+    return updated
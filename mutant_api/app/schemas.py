@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, validator
 from typing import List
+from .admission import admission_controller
 from .dna_service import DNAService
 
 class DNASequence(BaseModel):
@@ -7,26 +8,50 @@ class DNASequence(BaseModel):
     dna: List[str] = Field(..., description="List of strings representing the DNA matrix.")
 
     @validator('dna')
-    def validate_dna_sequence(cls, v):
+    def validate_dna_size(cls, v):
         """
-        Validator to ensure the DNA sequence is valid using DNAService.
+        Validator to reject oversized DNA matrices before any per-cell work.
+
+        The full validation of the DNA sequence (square matrix, valid bases) runs 
+        in the endpoints, off the event loop for large matrices.
         
         Args:
             v (List[str]): The DNA sequence to be validated.
 
         Raises:
-            ValueError: If the DNA sequence is invalid or contains errors.
+            RequestTooLargeError: If the DNA matrix exceeds the maximum size.
             
         Returns:
-            List[str]: The validated DNA sequence if valid.
+            List[str]: The DNA sequence.
         """
-        validation_result = DNAService.validate_and_check_existence(v, db=None)
-        if not validation_result.is_valid:
-            raise ValueError(validation_result.error_message)
+        admission_controller.check_size(len(v))
         return v
 
+class DNAEdit(BaseModel):
+    """Model for a single cell edit of a DNA matrix."""
+    row: int = Field(..., ge=0, description="Row index of the edited cell.")
+    col: int = Field(..., ge=0, description="Column index of the edited cell.")
+    base: str = Field(..., description="New base for the cell (A, T, C or G).")
+
+class DNAEditRequest(DNASequence):
+    """Model for re-analyzing a previously analyzed DNA matrix with a list of cell edits."""
+    edits: List[DNAEdit] = Field(
+        ...,
+        min_length=1,
+        max_length=DNAService.MAX_DNA_EDITS,
+        description="Cell edits to apply to the DNA matrix."
+    )
+
 class Stats(BaseModel):
     """Model for returning statistics about analyzed DNA sequences."""
     count_mutant_dna: int = Field(..., description="Count of mutant DNA sequences.")
     count_human_dna: int = Field(..., description="Count of human DNA sequences.")
-    ratio: float = Field(..., description="Ratio of mutant to human DNA sequences.")
\ No newline at end of file
+    ratio: float = Field(..., description="Ratio of mutant to human DNA sequences.")
+
+class AdmissionStats(BaseModel):
+    """Model for returning admission control statistics about detection work."""
+    queued_requests: int = Field(..., description="Heavy analyses queued or running on the worker pool.")
+    queued_cost: int = Field(..., description="Total estimated cost (cells) of queued heavy analyses.")
+    cost_budget: int = Field(..., description="Maximum queued cost before requests are shed.")
+    shed_count: int = Field(..., description="Requests rejected with 503 because the queue was over budget.")
+    too_large_count: int = Field(..., description="Requests rejected with 413 because the DNA matrix was too large.")
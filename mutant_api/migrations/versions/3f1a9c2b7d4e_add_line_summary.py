@@ -0,0 +1,33 @@
+"""add line_summary to dna_sequences
+
+Revision ID: 3f1a9c2b7d4e
+Revises: 
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2b7d4e'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The table itself is created by the application on startup; only
+    # add the column to databases created before it existed.
+    inspector = sa.inspect(op.get_bind())
+    if "dna_sequences" not in inspector.get_table_names():
+        return
+    columns = {column["name"] for column in inspector.get_columns("dna_sequences")}
+    if "line_summary" not in columns:
+        op.add_column("dna_sequences", sa.Column("line_summary", sa.Text(16777215), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("dna_sequences", "line_summary")
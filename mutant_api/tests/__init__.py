@@ -0,0 +1,11 @@
+"""
+Test suite for the Mutant Detection API.
+"""
+
+import os
+import tempfile
+
+# Run the API on a temporary SQLite database unless one is configured
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'mutant_dna.db')}"
+)
@@ -0,0 +1,112 @@
+"""
+Test suite for the admission control of DNA detection work.
+"""
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from app.admission import (
+    AdmissionController, AdmissionRejectedError, RequestTooLargeError, DETECTION_CELL_COST
+)
+
+
+def current_thread_name() -> str:
+    """Name of the thread running the work."""
+    return threading.current_thread().name
+
+
+class TestAdmissionController(unittest.TestCase):
+    """Test cases for the cost-aware admission controller."""
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="heavy")
+        self.controller = AdmissionController(
+            max_size=100,
+            heavy_size=10,
+            cost_budget=150 * DETECTION_CELL_COST,
+            retry_after=7,
+            executor=self.executor
+        )
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def cost(self, cells: int) -> int:
+        """Cost of detection work scanning the given number of cells."""
+        return cells * DETECTION_CELL_COST
+
+    def test_estimate_cost(self):
+        """Test case for the cost depending on the matrix size and the kind of work."""
+        self.assertEqual(AdmissionController.estimate_cost(10, 3), 300)
+        self.assertEqual(self.controller.heavy_cost, self.cost(100))
+
+    def test_light_work_runs_inline(self):
+        """Test case for work below the heavy threshold running on the calling thread."""
+        result = asyncio.run(self.controller.run(self.cost(99), current_thread_name))
+        self.assertEqual(result, threading.current_thread().name)
+
+    def test_heavy_work_runs_on_executor(self):
+        """Test case for work above the heavy threshold running on the worker pool."""
+        result = asyncio.run(self.controller.run(self.cost(100), current_thread_name))
+        self.assertTrue(result.startswith("heavy"))
+        self.assertEqual(self.controller.queued_requests, 0)
+        self.assertEqual(self.controller.queued_cost, 0)
+
+    def test_over_budget_is_shed(self):
+        """Test case for heavy work shed while the queued cost is over budget."""
+        release = threading.Event()
+
+        async def scenario():
+            blocking = asyncio.create_task(self.controller.run(self.cost(100), release.wait))
+            while not self.controller.queued_requests:
+                await asyncio.sleep(0)
+            self.assertEqual(self.controller.queued_cost, self.cost(100))
+            try:
+                with self.assertRaises(AdmissionRejectedError) as context:
+                    await self.controller.run(self.cost(100), current_thread_name)
+            finally:
+                release.set()
+                await blocking
+            return context.exception
+
+        error = asyncio.run(scenario())
+        self.assertEqual(error.retry_after, 7)
+        self.assertEqual(self.controller.shed_count, 1)
+        self.assertEqual(self.controller.stats()["shed_count"], 1)
+
+    def test_follow_up_work_is_not_shed(self):
+        """Test case for follow-up work of an admitted request queued over budget."""
+        self.controller.queued_requests = 1
+        self.controller.queued_cost = self.cost(150)
+        result = asyncio.run(self.controller.run(self.cost(100), current_thread_name, shed=False))
+        self.assertTrue(result.startswith("heavy"))
+        self.assertEqual(self.controller.shed_count, 0)
+        self.assertEqual(self.controller.queued_cost, self.cost(150))
+
+    def test_idle_pool_admits_over_budget(self):
+        """Test case for an idle pool admitting one request over the budget."""
+        result = asyncio.run(self.controller.run(self.cost(1000), current_thread_name))
+        self.assertTrue(result.startswith("heavy"))
+        self.assertEqual(self.controller.shed_count, 0)
+
+    def test_counters_restored_on_error(self):
+        """Test case for queue counters going back to their values when the work raises."""
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(self.controller.run(self.cost(100), fail))
+        self.assertEqual(self.controller.queued_requests, 0)
+        self.assertEqual(self.controller.queued_cost, 0)
+
+    def test_check_size(self):
+        """Test case for rejecting DNA matrices over the maximum size."""
+        self.controller.check_size(100)
+        with self.assertRaises(RequestTooLargeError):
+            self.controller.check_size(101)
+        self.assertEqual(self.controller.too_large_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,164 @@
+"""
+Test suite for the Mutant Detection API endpoints and their admission control.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+import httpx
+from fastapi.testclient import TestClient
+from app import models
+from app.admission import admission_controller
+from app.database import engine
+from app.dna_service import DNAService, DNAValidationResult
+from app.main import app
+
+
+def non_mutant_dna(n: int):
+    """NxN DNA matrix without any sequence of four identical letters."""
+    return [''.join("ATCG"[(2 * i + j) % 4] for j in range(n)) for i in range(n)]
+
+
+class TestMutantAPI(unittest.TestCase):
+    """Test cases for the API endpoints, with small admission control limits."""
+
+    MUTANT = ["ATGCGA", "CAGTGC", "TTATGT", "AGAAGG", "CCCCTA", "TCACTG"]
+
+    def setUp(self):
+        models.Base.metadata.drop_all(bind=engine)
+        models.Base.metadata.create_all(bind=engine)
+
+        # Small limits: matrices up to 20x20 and all detection work on the process pool
+        self.saved_limits = {
+            name: getattr(admission_controller, name)
+            for name in ("max_size", "heavy_cost", "cost_budget", "retry_after", "shed_count", "too_large_count")
+        }
+        admission_controller.max_size = 20
+        admission_controller.heavy_cost = 0
+        admission_controller.retry_after = 9
+
+        self.client = TestClient(app)
+        self.client.__enter__()
+
+    def tearDown(self):
+        self.client.__exit__(None, None, None)
+        for name, value in self.saved_limits.items():
+            setattr(admission_controller, name, value)
+        admission_controller.queued_requests = 0
+        admission_controller.queued_cost = 0
+
+    def test_mutant_and_human(self):
+        """Test case for analyzing mutant and human DNA on the process pool."""
+        response = self.client.post("/mutant/", json={"dna": self.MUTANT})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"is_mutant": True})
+
+        response = self.client.post("/mutant/", json={"dna": non_mutant_dna(10)})
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.post("/mutant/", json={"dna": self.MUTANT})
+        self.assertEqual(response.status_code, 409)
+        self.assertTrue(response.json()["is_mutant"])
+
+    def test_invalid_dna(self):
+        """Test case for invalid DNA being rejected as a request validation error."""
+        response = self.client.post("/mutant/", json={"dna": ["ATGC", "CAG"]})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["loc"], ["body", "dna"])
+
+    def test_too_large(self):
+        """Test case for DNA matrices over the maximum size being rejected with 413."""
+        response = self.client.post("/mutant/", json={"dna": non_mutant_dna(21)})
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(admission_controller.too_large_count, 1)
+
+    def test_shed_over_budget(self):
+        """Test case for heavy work over the queued cost budget being shed with 503."""
+        admission_controller.queued_requests = 1
+        admission_controller.queued_cost = admission_controller.cost_budget
+
+        response = self.client.post("/mutant/", json={"dna": self.MUTANT})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "9")
+
+        stats = self.client.get("/admission/").json()
+        self.assertEqual(stats["queued_requests"], 1)
+        self.assertEqual(stats["shed_count"], 1)
+
+    def test_admission_stats(self):
+        """Test case for the admission control statistics endpoint."""
+        response = self.client.get("/admission/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            "queued_requests": 0,
+            "queued_cost": 0,
+            "cost_budget": admission_controller.cost_budget,
+            "shed_count": 0,
+            "too_large_count": 0
+        })
+
+    def test_edits(self):
+        """Test case for re-analyzing edited DNA, building the line summary on the process pool."""
+        dna = non_mutant_dna(10)
+        self.client.post("/mutant/", json={"dna": dna})
+
+        # Four identical letters in the first row: one sequence, still human
+        edits = [{"row": 0, "col": col, "base": "A"} for col in range(4)]
+        response = self.client.post("/mutant/edits/", json={"dna": dna, "edits": edits})
+        self.assertEqual(response.status_code, 403)
+
+        # A second sequence in the first column makes it a mutant
+        edited = ["AAAA" + dna[0][4:]] + dna[1:]
+        edits = [{"row": row, "col": 0, "base": "A"} for row in range(1, 4)]
+        response = self.client.post("/mutant/edits/", json={"dna": edited, "edits": edits})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"is_mutant": True})
+
+    def test_edits_errors(self):
+        """Test case for edits of unknown DNA and invalid edits."""
+        edits = [{"row": 0, "col": 0, "base": "A"}]
+        response = self.client.post("/mutant/edits/", json={"dna": self.MUTANT, "edits": edits})
+        self.assertEqual(response.status_code, 404)
+
+        self.client.post("/mutant/", json={"dna": self.MUTANT})
+        edits = [{"row": 6, "col": 0, "base": "A"}]
+        response = self.client.post("/mutant/edits/", json={"dna": self.MUTANT, "edits": edits})
+        self.assertEqual(response.status_code, 400)
+
+    def test_concurrent_duplicates(self):
+        """Test case for identical concurrent submissions: one is stored, the other conflicts."""
+        dna = non_mutant_dna(12)
+        edits = [{"row": 0, "col": col, "base": "A"} for col in range(4)]
+
+        async def submit_twice(path, body):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                responses = await asyncio.gather(client.post(path, json=body), client.post(path, json=body))
+            return sorted(response.status_code for response in responses)
+
+        self.assertEqual(asyncio.run(submit_twice("/mutant/", {"dna": dna})), [403, 409])
+        self.assertEqual(
+            asyncio.run(submit_twice("/mutant/edits/", {"dna": dna, "edits": edits})), [403, 409]
+        )
+
+    def test_duplicate_stored_during_analysis(self):
+        """Test case for a duplicate stored after the existence check (unique constraint)."""
+        self.client.post("/mutant/", json={"dna": self.MUTANT})
+
+        # Another worker stored the sequence between the existence check and the insert
+        not_processed = DNAValidationResult(
+            is_valid=True, sequence_hash=DNAService.calculate_hash(self.MUTANT)
+        )
+        check_existence = DNAService.check_existence
+        results = iter([not_processed])
+        with mock.patch.object(
+            DNAService, "check_existence",
+            side_effect=lambda sequence_hash, db: next(results, None) or check_existence(sequence_hash, db)
+        ):
+            response = self.client.post("/mutant/", json={"dna": self.MUTANT})
+        self.assertEqual(response.status_code, 409)
+        self.assertTrue(response.json()["is_mutant"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,128 @@
+"""
+Test suite for the incremental re-analysis of edited DNA matrices.
+"""
+
+import random
+import unittest
+from typing import List
+from app.dna_service import LineSummary
+from app.mutant_detector import (
+    is_mutant, summarize_lines, apply_edits, prepare_edits, reanalyze_lines, DNAValidationError
+)
+from app.dna_service import DNAService
+
+
+def random_dna(rng: random.Random, n: int, bases: str) -> List[str]:
+    """Build a random NxN DNA matrix using the given bases."""
+    return [''.join(rng.choice(bases) for _ in range(n)) for _ in range(n)]
+
+
+class TestLineSummary(unittest.TestCase):
+    """Test cases for the per-line run summary and incremental re-analysis."""
+
+    MUTANT = [
+        "ATGCGA",
+        "CAGTGC",
+        "TTATGT",
+        "AGAAGG",
+        "CCCCTA",
+        "TCACTG"
+    ]
+
+    def setUp(self):
+        self.rng = random.Random(26)
+
+    def random_case(self) -> List[str]:
+        """Random matrix; few bases make runs (and mutants) common."""
+        return random_dna(self.rng, self.rng.randint(1, 10), self.rng.choice(["A", "AT", "ATC", "ATCG"]))
+
+    def random_edits(self, n: int):
+        """Random (row, column, base) edits inside an NxN matrix."""
+        return [
+            (self.rng.randrange(n), self.rng.randrange(n), self.rng.choice("ATCG"))
+            for _ in range(self.rng.randint(1, 4))
+        ]
+
+    def test_summary_counts_sequences(self):
+        """Test case for the summary of a known mutant DNA sequence."""
+        summary = summarize_lines(self.MUTANT)
+        self.assertEqual(summary.rows, {4})
+        self.assertEqual(summary.columns, {4})
+        self.assertEqual(summary.diagonals, {0: 1})
+        self.assertEqual(summary.anti_diagonals, {})
+        self.assertTrue(summary.is_mutant)
+
+    def test_summary_matches_is_mutant(self):
+        """Test case for the summary verdict matching is_mutant."""
+        for _ in range(1000):
+            dna = self.random_case()
+            self.assertEqual(summarize_lines(dna).is_mutant, is_mutant(dna), dna)
+
+    def test_reanalyze_matches_full_summary(self):
+        """Test case for incremental re-analysis matching a full summary of the edited matrix."""
+        for _ in range(1000):
+            dna = self.random_case()
+            edits = self.random_edits(len(dna))
+            self.assertEqual(
+                reanalyze_lines(dna, summarize_lines(dna), edits),
+                summarize_lines(apply_edits(dna, edits)),
+                (dna, edits)
+            )
+
+    def test_summary_without_validation(self):
+        """Test case for skipping the validation of an already validated DNA sequence."""
+        self.assertEqual(summarize_lines(self.MUTANT, False), summarize_lines(self.MUTANT))
+
+    def test_prepare_edits(self):
+        """Test case for validating, editing and hashing a DNA matrix in one task."""
+        edits = [(4, 0, "T")]
+        reference, edited_hash = prepare_edits(self.MUTANT, edits)
+        self.assertTrue(reference.is_valid)
+        self.assertEqual(reference.sequence_hash, DNAService.calculate_hash(self.MUTANT))
+        self.assertEqual(edited_hash, DNAService.calculate_hash(apply_edits(self.MUTANT, edits)))
+
+        reference, edited_hash = prepare_edits(["AT", "A"], edits)
+        self.assertFalse(reference.is_valid)
+        self.assertEqual(edited_hash, "")
+
+        with self.assertRaises(DNAValidationError):
+            prepare_edits(self.MUTANT, [(6, 0, "A")])
+
+    def test_encode_round_trip(self):
+        """Test case for encoding and decoding a summary."""
+        for _ in range(500):
+            summary = summarize_lines(self.random_case())
+            self.assertEqual(LineSummary.decode(summary.encode()), summary)
+
+    def test_apply_edits(self):
+        """Test case for applying cell edits without modifying the original matrix."""
+        edited = apply_edits(self.MUTANT, [(4, 0, "T"), (0, 5, "C")])
+        self.assertEqual(edited[4], "TCCCTA")
+        self.assertEqual(edited[0], "ATGCGC")
+        self.assertEqual(self.MUTANT[4], "CCCCTA")
+
+    def test_apply_edits_same_row(self):
+        """Test case for several edits of the same row, the last edit of a cell winning."""
+        edited = apply_edits(self.MUTANT, [(1, 0, "T"), (1, 5, "T"), (1, 0, "G")])
+        self.assertEqual(edited[1], "GAGTGT")
+
+    def test_edit_out_of_bounds(self):
+        """Test case for an edit outside the DNA matrix."""
+        for row, col in [(6, 0), (0, 6), (-1, 0)]:
+            with self.assertRaises(DNAValidationError):
+                apply_edits(self.MUTANT, [(row, col, "A")])
+
+    def test_edit_invalid_base(self):
+        """Test case for an edit with an invalid base."""
+        with self.assertRaises(DNAValidationError):
+            apply_edits(self.MUTANT, [(0, 0, "Z")])
+
+    def test_summary_size_mismatch(self):
+        """Test case for re-analyzing with the summary of a different size matrix."""
+        summary = summarize_lines([row[:4] for row in self.MUTANT[:4]])
+        with self.assertRaises(DNAValidationError):
+            reanalyze_lines(self.MUTANT, summary, [(0, 0, "A")])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)